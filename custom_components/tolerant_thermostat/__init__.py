@@ -2,13 +2,17 @@
 
 import logging
 
+from homeassistant.components import valve
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, split_entity_id
+from homeassistant.exceptions import ConfigEntryError
 from homeassistant.helpers.device import (
     async_remove_stale_devices_links_keep_entity_device,
 )
 
+from .actuation import valve_supports_position
 from .const import CONF_HEATER, CONF_PRECISION, CONF_TEMP_STEP, PLATFORMS
+from .store import async_get_store
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,6 +20,16 @@ _LOGGER = logging.getLogger(__name__)
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up from a config entry."""
 
+    heater_entity_id = entry.options[CONF_HEATER]
+    if (
+        split_entity_id(heater_entity_id)[0] == valve.DOMAIN
+        and (heater_state := hass.states.get(heater_entity_id)) is not None
+        and not valve_supports_position(heater_state)
+    ):
+        raise ConfigEntryError(
+            f"Valve {heater_entity_id} does not support setting a position"
+        )
+
     async_remove_stale_devices_links_keep_entity_device(
         hass,
         entry.entry_id,
@@ -36,6 +50,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted controller state of a removed config entry."""
+    store = await async_get_store(hass)
+    store.async_remove(entry.entry_id)
+
+
 async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Migrate old entry."""
     _LOGGER.debug(
@@ -0,0 +1,168 @@
+"""Actuation acknowledgement tracking for the Tolerant Thermostat."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+
+from homeassistant.components import valve
+from homeassistant.const import ATTR_SUPPORTED_FEATURES
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util import dt as dt_util
+
+from .const import ACTUATION_MAX_RETRIES, ACTUATION_TIMEOUT, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_ACTUATION_TRACKER = f"{DOMAIN}_actuation_tracker"
+
+
+def valve_supports_position(state: State) -> bool:
+    """Return if a valve can be set to a position."""
+    return bool(
+        state.attributes.get(ATTR_SUPPORTED_FEATURES, 0)
+        & valve.ValveEntityFeature.SET_POSITION
+    )
+
+
+@dataclass
+class PendingActuation:
+    """Command sent to an actuator and not yet confirmed by its state."""
+
+    entity_id: str
+    command: str
+    is_confirmed: Callable[[State], bool]
+    retry: Callable[[], Coroutine[Any, Any, None]]
+    issued: datetime
+    deadline: datetime
+    retries: int = 0
+
+
+class ActuationTracker:
+    """Track actuator commands of all thermostats until they are confirmed.
+
+    Timeouts of all pending commands are handled by a single timer, which
+    is always scheduled for the earliest deadline. On timeout the command is
+    not replayed: the retry callback re-runs the control decision, which
+    either sends the command again or cancels it when no longer wanted.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the tracker."""
+        self.hass = hass
+        self._pending: dict[str, PendingActuation] = {}
+        self._unsub_timeout: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_track(
+        self,
+        key: str,
+        entity_id: str,
+        command: str,
+        is_confirmed: Callable[[State], bool],
+        retry: Callable[[], Coroutine[Any, Any, None]],
+    ) -> None:
+        """Start tracking a command, replacing a pending one with the same key.
+
+        Sending exactly the same command, including its service data, again
+        while it is pending keeps its issue time, deadline and retry count,
+        so retries stay bounded.
+        """
+        if (pending := self._pending.get(key)) is not None and (
+            pending.command == command
+        ):
+            pending.is_confirmed = is_confirmed
+            return
+
+        now = dt_util.utcnow()
+        self._pending[key] = PendingActuation(
+            entity_id,
+            command,
+            is_confirmed,
+            retry,
+            now,
+            now + timedelta(seconds=ACTUATION_TIMEOUT),
+        )
+        self._async_schedule_timeout()
+
+    @callback
+    def async_confirm(self, key: str, state: State) -> timedelta | None:
+        """Confirm a pending command and return its latency if state matches."""
+        pending = self._pending.get(key)
+        if pending is None or not pending.is_confirmed(state):
+            return None
+
+        del self._pending[key]
+        self._async_schedule_timeout()
+        return state.last_updated - pending.issued
+
+    @callback
+    def async_is_pending(self, key: str) -> bool:
+        """Return if a command with the given key is not yet confirmed."""
+        return key in self._pending
+
+    @callback
+    def async_cancel(self, key: str) -> None:
+        """Stop tracking a pending command."""
+        if self._pending.pop(key, None) is not None:
+            self._async_schedule_timeout()
+
+    @callback
+    def _async_schedule_timeout(self) -> None:
+        """Schedule the shared timer for the earliest pending deadline."""
+        if self._unsub_timeout is not None:
+            self._unsub_timeout()
+            self._unsub_timeout = None
+
+        if not self._pending:
+            return
+
+        self._unsub_timeout = async_track_point_in_utc_time(
+            self.hass,
+            self._async_handle_timeout,
+            min(pending.deadline for pending in self._pending.values()),
+        )
+
+    @callback
+    def _async_handle_timeout(self, now: datetime) -> None:
+        """Retry or give up on commands with expired deadlines."""
+        self._unsub_timeout = None
+
+        for key, pending in list(self._pending.items()):
+            if pending.deadline > now:
+                continue
+
+            if pending.retries >= ACTUATION_MAX_RETRIES:
+                _LOGGER.warning(
+                    "%s: command was not confirmed after %s retries, giving up",
+                    pending.entity_id,
+                    pending.retries,
+                )
+                del self._pending[key]
+                continue
+
+            pending.retries += 1
+            pending.deadline = now + timedelta(
+                seconds=ACTUATION_TIMEOUT * 2**pending.retries
+            )
+            _LOGGER.debug(
+                "%s: command was not confirmed in time, retry %s of %s",
+                pending.entity_id,
+                pending.retries,
+                ACTUATION_MAX_RETRIES,
+            )
+            self.hass.async_create_task(pending.retry(), eager_start=True)
+
+        self._async_schedule_timeout()
+
+
+@singleton(DATA_ACTUATION_TRACKER)
+@callback
+def async_get_actuation_tracker(hass: HomeAssistant) -> ActuationTracker:
+    """Return the shared actuation tracker."""
+    return ActuationTracker(hass)
@@ -1,14 +1,16 @@
 """Adds support for Tolerant Thermostat units."""
 
 import asyncio
-from collections.abc import Mapping
-from datetime import timedelta
+from collections.abc import Callable, Mapping
+from datetime import datetime, timedelta
+from functools import partial
 import logging
 import math
 from typing import Any
 
 import voluptuous as vol
 
+from homeassistant.components import input_number, number, valve
 from homeassistant.components.climate import (
     ATTR_TARGET_TEMP_HIGH,
     ATTR_TARGET_TEMP_LOW,
@@ -27,6 +29,7 @@ from homeassistant.const import (
     PRECISION_HALVES,
     PRECISION_TENTHS,
     PRECISION_WHOLE,
+    SERVICE_SET_VALVE_POSITION,
     SERVICE_TURN_OFF,
     SERVICE_TURN_ON,
     STATE_OFF,
@@ -36,6 +39,7 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     DOMAIN as HOMEASSISTANT_DOMAIN,
     CoreState,
     Event,
@@ -43,15 +47,25 @@ from homeassistant.core import (
     HomeAssistant,
     State,
     callback,
+    split_entity_id,
 )
 from homeassistant.exceptions import ConditionError
 from homeassistant.helpers import condition, config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import (
+    async_track_point_in_utc_time,
+    async_track_state_change_event,
+)
 from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.util import dt as dt_util
 
+from .actuation import (
+    ActuationTracker,
+    async_get_actuation_tracker,
+    valve_supports_position,
+)
 from .const import (
     CONF_AC_MODE,
     CONF_HEATER,
@@ -59,18 +73,30 @@ from .const import (
     CONF_MAX_TEMP,
     CONF_MIN_DUR,
     CONF_MIN_TEMP,
+    CONF_OUTPUT_DEADBAND,
     CONF_PRECISION,
+    CONF_PREDICTIVE,
     CONF_SENSOR,
     CONF_TARGET_TEMP_HIGH,
     CONF_TARGET_TEMP_LOW,
     CONF_TEMP_STEP,
     DEFAULT_NAME,
+    DEFAULT_OUTPUT_DEADBAND,
     DOMAIN,
+    OUTPUT_INTEGRAL_LIMIT,
+    OUTPUT_INTEGRAL_TIME,
     PLATFORMS,
+    PREDICTION_MAX_GAP,
+    PREDICTION_SAMPLES,
 )
+from .prediction import TemperaturePredictor
+from .store import TolerantThermostatStore, async_get_store
 
 _LOGGER = logging.getLogger(__name__)
 
+NUMERIC_OUTPUT_DOMAINS = (input_number.DOMAIN, number.DOMAIN, valve.DOMAIN)
+
+
 PLATFORM_SCHEMA_COMMON = vol.Schema(
     {
         vol.Optional(CONF_NAME, default=DEFAULT_NAME): cv.string,
@@ -90,6 +116,10 @@ PLATFORM_SCHEMA_COMMON = vol.Schema(
         vol.Optional(CONF_TEMP_STEP): vol.All(
             vol.In([PRECISION_TENTHS, PRECISION_HALVES, PRECISION_WHOLE])
         ),
+        vol.Optional(CONF_PREDICTIVE, default=False): cv.boolean,
+        vol.Optional(CONF_OUTPUT_DEADBAND, default=DEFAULT_OUTPUT_DEADBAND): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=100)
+        ),
     }
 )
 
@@ -144,8 +174,22 @@ async def _async_setup_config(
     min_cycle_duration: timedelta | None = config.get(CONF_MIN_DUR)
     precision: float | None = config.get(CONF_PRECISION)
     target_temperature_step: float | None = config.get(CONF_TEMP_STEP)
+    predictive: bool | None = config.get(CONF_PREDICTIVE)
+    output_deadband: float | None = config.get(CONF_OUTPUT_DEADBAND)
     unit = hass.config.units.temperature_unit
 
+    if (
+        split_entity_id(heater_entity_id)[0] == valve.DOMAIN
+        and (heater_state := hass.states.get(heater_entity_id)) is not None
+        and not valve_supports_position(heater_state)
+    ):
+        _LOGGER.error(
+            "%s: valve %s does not support setting a position",
+            name,
+            heater_entity_id,
+        )
+        return
+
     async_add_entities(
         [
             TolerantThermostat(
@@ -162,6 +206,8 @@ async def _async_setup_config(
                 min_cycle_duration,
                 precision,
                 target_temperature_step,
+                predictive,
+                output_deadband,
                 unit,
                 unique_id,
             )
@@ -190,6 +236,8 @@ class TolerantThermostat(ClimateEntity, RestoreEntity):
         min_cycle_duration: timedelta | None,
         precision: float | None,
         target_temperature_step: float | None,
+        predictive: bool | None,
+        output_deadband: float | None,
         unit: UnitOfTemperature,
         unique_id: str | None,
     ) -> None:
@@ -211,6 +259,24 @@ class TolerantThermostat(ClimateEntity, RestoreEntity):
         self._target_temp_high = target_temp_high
         self._target_temp_low = target_temp_low
         self._attr_temperature_unit = unit
+        self._store: TolerantThermostatStore | None = None
+        self._last_switch: datetime | None = None
+        self._switch_count = 0
+        self._actuation_tracker: ActuationTracker | None = None
+        self._actuation_latency: float | None = None
+        self._predictor = (
+            TemperaturePredictor(PREDICTION_SAMPLES, PREDICTION_MAX_GAP)
+            if predictive
+            else None
+        )
+        self._unsub_prediction: CALLBACK_TYPE | None = None
+        self._heater_domain = split_entity_id(heater_entity_id)[0]
+        self._numeric_output = self._heater_domain in NUMERIC_OUTPUT_DOMAINS
+        self._output_deadband = (
+            output_deadband if output_deadband is not None else DEFAULT_OUTPUT_DEADBAND
+        )
+        self._output_integral = 0.0
+        self._output_updated: datetime | None = None
 
         if self._inverted:
             self._attr_hvac_modes = [HVACMode.COOL, HVACMode.OFF]
@@ -227,6 +293,15 @@ class TolerantThermostat(ClimateEntity, RestoreEntity):
         """Run when entity about to be added."""
         await super().async_added_to_hass()
 
+        self._store = await async_get_store(self.hass)
+        self._async_restore_controller_state()
+
+        self._actuation_tracker = async_get_actuation_tracker(self.hass)
+        self.async_on_remove(
+            partial(self._actuation_tracker.async_cancel, self._store_key)
+        )
+        self.async_on_remove(self._async_cancel_prediction)
+
         self.async_on_remove(
             async_track_state_change_event(
                 self.hass, [self.sensor_entity_id], self._async_sensor_changed
@@ -315,6 +390,56 @@ class TolerantThermostat(ClimateEntity, RestoreEntity):
             )
             self._hvac_mode = HVACMode.OFF
 
+    @property
+    def _store_key(self) -> str:
+        """Return the key of the thermostat controller state in the store."""
+        return self.unique_id or self.entity_id
+
+    @callback
+    def _async_restore_controller_state(self) -> None:
+        """Restore controller state persisted in the store."""
+        assert self._store is not None
+        data = self._store.async_get(self._store_key)
+
+        if (last_switch := data.get("last_switch")) is not None:
+            self._last_switch = dt_util.parse_datetime(last_switch)
+        self._switch_count = data.get("switch_count", 0)
+        self._actuation_latency = data.get("actuation_latency")
+        self._output_integral = data.get("output_integral", 0.0)
+
+        _LOGGER.debug(
+            "%s: restored controller state: last switch %s, switch count %s",
+            self.entity_id,
+            self._last_switch,
+            self._switch_count,
+        )
+
+    @callback
+    def _async_save_controller_state(self) -> None:
+        """Schedule saving of the controller state to the store."""
+        if self._store is None:
+            return
+
+        self._store.async_update(
+            self._store_key,
+            {
+                "last_switch": (
+                    self._last_switch.isoformat() if self._last_switch else None
+                ),
+                "switch_count": self._switch_count,
+                "actuation_latency": self._actuation_latency,
+                "output_integral": self._output_integral,
+            },
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the device specific state attributes."""
+        return {
+            "switch_count": self._switch_count,
+            "actuation_latency": self._actuation_latency,
+        }
+
     @property
     def precision(self) -> float:
         """Return the precision of the system."""
@@ -384,6 +509,9 @@ class TolerantThermostat(ClimateEntity, RestoreEntity):
         if not self.hass.states.get(self.heater_entity_id):
             return None
 
+        if self._numeric_output:
+            return bool(self._output_demand)
+
         return self.hass.states.is_state(
             self.heater_entity_id, STATE_ON if not self._inverted else STATE_OFF
         )
@@ -403,10 +531,21 @@ class TolerantThermostat(ClimateEntity, RestoreEntity):
             return
 
         self._hvac_mode = hvac_mode
-        if self._hvac_mode == HVACMode.OFF and self._is_device_active:
-            await self._async_heater_turn_off()
+        command_pending = False
+        if self._hvac_mode == HVACMode.OFF:
+            self._output_updated = None
+            assert self._actuation_tracker is not None
+            command_pending = self._actuation_tracker.async_is_pending(self._store_key)
+            self._async_cancel_actuation()
+        if self._hvac_mode == HVACMode.OFF and (
+            self._is_device_active or command_pending
+        ):
+            # An unconfirmed command may still switch the device on late,
+            # so the device is turned off even if it is not active yet.
+            await self._async_heater_turn_off(force=command_pending)
         else:
             await self._async_control(force=True)
+        self._async_schedule_prediction()
         self.async_write_ha_state()
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
@@ -425,16 +564,21 @@ class TolerantThermostat(ClimateEntity, RestoreEntity):
             self._target_temp_high = self._round_to_target_precision(temp_high)
 
         await self._async_control(force=True)
+        self._async_schedule_prediction()
         self.async_write_ha_state()
 
     async def _async_sensor_changed(self, event: Event[EventStateChangedData]) -> None:
         """Handle temperature changes."""
         new_state = event.data["new_state"]
         if new_state is None or new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            self._async_cancel_prediction()
+            if self._predictor is not None:
+                self._predictor.clear()
             return
 
         self._async_update_temp(new_state)
         await self._async_control()
+        self._async_schedule_prediction()
         self.async_write_ha_state()
 
     @callback
@@ -444,10 +588,30 @@ class TolerantThermostat(ClimateEntity, RestoreEntity):
         old_state = event.data["old_state"]
         if new_state is None:
             return
+        assert self._actuation_tracker is not None
+        if (
+            latency := self._actuation_tracker.async_confirm(self._store_key, new_state)
+        ) is not None:
+            self._actuation_latency = round(latency.total_seconds(), 3)
+            _LOGGER.debug(
+                "%s: target device %s confirmed command in %s s",
+                self.entity_id,
+                self.heater_entity_id,
+                self._actuation_latency,
+            )
+            self._async_save_controller_state()
         if old_state is None:
             self.hass.async_create_task(
                 self._check_switch_initial_state(), eager_start=True
             )
+        elif (
+            old_state.state in (STATE_ON, STATE_OFF)
+            and new_state.state in (STATE_ON, STATE_OFF)
+            and old_state.state != new_state.state
+        ):
+            self._last_switch = new_state.last_changed
+            self._switch_count += 1
+            self._async_save_controller_state()
         self.async_write_ha_state()
 
     async def _check_switch_initial_state(self) -> None:
@@ -470,9 +634,86 @@ class TolerantThermostat(ClimateEntity, RestoreEntity):
                     f"{self.entity_id}: sensor has illegal state: {state.state}"
                 )
             self._cur_temp = cur_temp
+            if self._predictor is not None:
+                self._predictor.add(state.last_updated, cur_temp)
         except ValueError as ex:
             _LOGGER.error("%s: unable to update from sensor: %s", self.entity_id, ex)
 
+    @callback
+    def _async_schedule_prediction(self) -> None:
+        """Schedule control at the predicted crossing of a target temperature."""
+        self._async_cancel_prediction()
+        if self._predictor is None or self._hvac_mode == HVACMode.OFF:
+            return
+
+        now = dt_util.utcnow()
+        crossing_times = [
+            crossing_time
+            for target_temp in (self._target_temp_low, self._target_temp_high)
+            if target_temp is not None
+            and (crossing_time := self._predictor.crossing_time(target_temp, now))
+            is not None
+        ]
+        if not crossing_times:
+            return
+
+        crossing_time = min(crossing_times)
+        _LOGGER.debug(
+            "%s: target temperature crossing predicted at %s",
+            self.entity_id,
+            crossing_time,
+        )
+        self._unsub_prediction = async_track_point_in_utc_time(
+            self.hass, self._async_prediction_reached, crossing_time
+        )
+
+    @callback
+    def _async_cancel_prediction(self) -> None:
+        """Cancel scheduled control at a predicted crossing."""
+        if self._unsub_prediction is not None:
+            self._unsub_prediction()
+            self._unsub_prediction = None
+
+    async def _async_prediction_reached(self, now: datetime) -> None:
+        """Update temperature with extrapolated value and control."""
+        self._unsub_prediction = None
+        assert self._predictor is not None
+        if (predicted_temp := self._predictor.predict(now)) is None:
+            return
+
+        _LOGGER.debug(
+            "%s: updating with predicted temperature %s",
+            self.entity_id,
+            predicted_temp,
+        )
+        self._cur_temp = predicted_temp
+        await self._async_control()
+        self.async_write_ha_state()
+
+        if (cycle_end := self._min_cycle_end) is not None and cycle_end > now:
+            # Switching may have been blocked by min_cycle_duration, so check
+            # again as soon as the minimum cycle is over.
+            self._unsub_prediction = async_track_point_in_utc_time(
+                self.hass, self._async_prediction_reached, cycle_end
+            )
+            return
+
+        self._async_schedule_prediction()
+
+    @property
+    def _min_cycle_end(self) -> datetime | None:
+        """Return when the current cycle reaches min_cycle_duration."""
+        if not self.min_cycle_duration or self._numeric_output:
+            return None
+
+        if self._last_switch is not None:
+            return self._last_switch + self.min_cycle_duration
+
+        if (state := self.hass.states.get(self.heater_entity_id)) is None:
+            return None
+
+        return state.last_changed + self.min_cycle_duration
+
     async def _async_heater_turn_on(self) -> None:
         """Turn heater toggleable device on."""
         _LOGGER.debug(
@@ -480,25 +721,161 @@ class TolerantThermostat(ClimateEntity, RestoreEntity):
         )
 
         service = SERVICE_TURN_ON if not self._inverted else SERVICE_TURN_OFF
-        service_data = {ATTR_ENTITY_ID: self.heater_entity_id}
-
-        await self.hass.services.async_call(
-            HOMEASSISTANT_DOMAIN, service, service_data, context=self._context
+        expected_state = STATE_ON if not self._inverted else STATE_OFF
+        await self._async_heater_call(
+            HOMEASSISTANT_DOMAIN,
+            service,
+            {},
+            lambda state: state.state == expected_state,
         )
 
-    async def _async_heater_turn_off(self) -> None:
+    async def _async_heater_turn_off(self, force: bool = False) -> None:
         """Turn heater toggleable device off."""
         _LOGGER.debug(
             "%s: turning OFF target device %s", self.entity_id, self.heater_entity_id
         )
 
+        if self._numeric_output:
+            await self._async_heater_set_output(0.0, force=force)
+            return
+
         service = SERVICE_TURN_OFF if not self._inverted else SERVICE_TURN_ON
-        service_data = {ATTR_ENTITY_ID: self.heater_entity_id}
+        expected_state = STATE_OFF if not self._inverted else STATE_ON
+        await self._async_heater_call(
+            HOMEASSISTANT_DOMAIN,
+            service,
+            {},
+            lambda state: state.state == expected_state,
+        )
+
+    @property
+    def _output_demand(self) -> float | None:
+        """Return the numeric actuator output as a fraction of its full range."""
+        if (state := self.hass.states.get(self.heater_entity_id)) is None:
+            return None
+
+        try:
+            if self._heater_domain == valve.DOMAIN:
+                position = float(state.attributes[valve.ATTR_CURRENT_POSITION]) / 100
+            else:
+                value_min, value_max = self._output_range(state)
+                position = (float(state.state) - value_min) / (value_max - value_min)
+        except (KeyError, TypeError, ValueError, ZeroDivisionError):
+            return None
+
+        return 1 - position if self._inverted else position
+
+    @staticmethod
+    def _output_range(state: State) -> tuple[float, float]:
+        """Return the value range of a number actuator."""
+        return (
+            float(state.attributes.get(number.ATTR_MIN, 0)),
+            float(state.attributes.get(number.ATTR_MAX, 100)),
+        )
+
+    async def _async_heater_set_output(
+        self, demand: float, force: bool = False
+    ) -> None:
+        """Set numeric actuator output to a fraction of its full range."""
+        if (state := self.hass.states.get(self.heater_entity_id)) is None:
+            return
+
+        position = 1 - demand if self._inverted else demand
+
+        if self._heater_domain == valve.DOMAIN:
+            if not valve_supports_position(state):
+                if self._attr_available:
+                    _LOGGER.error(
+                        "%s: target device %s does not support setting a position",
+                        self.entity_id,
+                        self.heater_entity_id,
+                    )
+                    self._attr_available = False
+                    self.async_write_ha_state()
+                return
+            self._attr_available = True
+            value: float = round(position * 100)
+            tolerance = 0.5
+            service = SERVICE_SET_VALVE_POSITION
+            data = {valve.ATTR_POSITION: value}
+        else:
+            value_min, value_max = self._output_range(state)
+            value = value_min + position * (value_max - value_min)
+            tolerance = 1e-6
+            if step := state.attributes.get(number.ATTR_STEP):
+                value = round(value / step) * step
+                tolerance += step / 2
+            service = number.SERVICE_SET_VALUE
+            data = {number.ATTR_VALUE: value}
+
+        def _is_confirmed(state: State) -> bool:
+            try:
+                if self._heater_domain == valve.DOMAIN:
+                    current = float(state.attributes[valve.ATTR_CURRENT_POSITION])
+                else:
+                    current = float(state.state)
+            except (KeyError, TypeError, ValueError):
+                return False
+            return abs(current - value) <= tolerance
+
+        if not force and _is_confirmed(state):
+            _LOGGER.debug(
+                "%s: target device %s already at %s, skipping",
+                self.entity_id,
+                self.heater_entity_id,
+                value,
+            )
+            self._async_cancel_actuation()
+            return
 
+        _LOGGER.debug(
+            "%s: setting target device %s to %s",
+            self.entity_id,
+            self.heater_entity_id,
+            value,
+        )
+        await self._async_heater_call(self._heater_domain, service, data, _is_confirmed)
+
+    async def _async_heater_call(
+        self,
+        domain: str,
+        service: str,
+        data: dict[str, Any],
+        is_confirmed: Callable[[State], bool],
+    ) -> None:
+        """Call heater service and track it until the heater state confirms it."""
+        assert self._actuation_tracker is not None
+        self._actuation_tracker.async_track(
+            self._store_key,
+            self.heater_entity_id,
+            f"{domain}.{service} {data}",
+            is_confirmed,
+            self._async_actuation_retry,
+        )
         await self.hass.services.async_call(
-            HOMEASSISTANT_DOMAIN, service, service_data, context=self._context
+            domain,
+            service,
+            {ATTR_ENTITY_ID: self.heater_entity_id, **data},
+            context=self._context,
         )
 
+    async def _async_actuation_retry(self) -> None:
+        """Re-run the control decision for an unconfirmed command."""
+        if self._hvac_mode == HVACMode.OFF:
+            if self._is_device_active:
+                await self._async_heater_turn_off()
+            else:
+                self._async_cancel_actuation()
+            return
+
+        await self._async_control(force=True)
+
+    @callback
+    def _async_cancel_actuation(self) -> None:
+        """Stop tracking a pending command which is no longer wanted."""
+        assert self._actuation_tracker is not None
+        self._actuation_tracker.async_cancel(self._store_key)
+
     def _round_to_target_precision(self, value: float) -> float:
         step = self.target_temperature_step
         if step and value is not None:
@@ -506,55 +883,136 @@ class TolerantThermostat(ClimateEntity, RestoreEntity):
 
         return value
 
+    def _need_turn_on_off(self) -> tuple[bool, bool]:
+        """Return if the current temperature requires turning device on or off."""
+        assert None not in (
+            self._cur_temp,
+            self._target_temp_low,
+            self._target_temp_high,
+        )
+
+        too_cold = self._cur_temp <= self._target_temp_low
+        too_hot = self._cur_temp >= self._target_temp_high
+
+        need_turn_on = (
+            too_hot
+            and self._hvac_mode == HVACMode.COOL
+            or too_cold
+            and self._hvac_mode == HVACMode.HEAT
+        )
+
+        need_turn_off = (
+            too_cold
+            and self._hvac_mode == HVACMode.COOL
+            or too_hot
+            and self._hvac_mode == HVACMode.HEAT
+        )
+
+        return need_turn_on, need_turn_off
+
     async def _async_control(self, force: bool = False) -> None:
         """Check if we need to turn target device on or off."""
         if self._hvac_mode == HVACMode.OFF:
             return
 
         async with self._temp_lock:
-            if not force and self.min_cycle_duration:
-                if self._is_device_active:
-                    current_state = STATE_ON
-                else:
-                    current_state = HVACMode.OFF
+            if self._numeric_output:
+                await self._async_control_output()
+                return
 
-                try:
-                    long_enough = condition.state(
-                        self.hass,
-                        self.heater_entity_id,
-                        current_state,
-                        self.min_cycle_duration,
+            if not force and self.min_cycle_duration:
+                if self._last_switch is not None:
+                    long_enough = (
+                        dt_util.utcnow() - self._last_switch >= self.min_cycle_duration
                     )
-                except ConditionError:
-                    long_enough = False
+                else:
+                    if self._is_device_active:
+                        current_state = STATE_ON
+                    else:
+                        current_state = HVACMode.OFF
+
+                    try:
+                        long_enough = condition.state(
+                            self.hass,
+                            self.heater_entity_id,
+                            current_state,
+                            self.min_cycle_duration,
+                        )
+                    except ConditionError:
+                        long_enough = False
 
                 if not long_enough:
                     return
 
-            assert None not in (
-                self._cur_temp,
-                self._target_temp_low,
-                self._target_temp_high,
-            )
+            need_turn_on, need_turn_off = self._need_turn_on_off()
 
-            too_cold = self._cur_temp <= self._target_temp_low
-            too_hot = self._cur_temp >= self._target_temp_high
+            if self._is_device_active and need_turn_off:
+                await self._async_heater_turn_off()
+            elif not self._is_device_active and need_turn_on:
+                await self._async_heater_turn_on()
+            else:
+                self._async_cancel_actuation()
+
+    async def _async_control_output(self) -> None:
+        """Set numeric actuator output from the temperature within the target range."""
+        assert None not in (
+            self._cur_temp,
+            self._target_temp_low,
+            self._target_temp_high,
+        )
 
-            need_turn_on = (
-                too_hot
-                and self._hvac_mode == HVACMode.COOL
-                or too_cold
-                and self._hvac_mode == HVACMode.HEAT
+        band = max(self._target_temp_high - self._target_temp_low, PRECISION_TENTHS)
+        error = (
+            (self._target_temp_low + self._target_temp_high) / 2 - self._cur_temp
+        ) / band
+        if self._hvac_mode == HVACMode.COOL:
+            error = -error
+
+        now = dt_util.utcnow()
+        output = 0.5 + error + self._output_integral
+        # Conditional integration: do not wind up while the output is
+        # saturated and the error pushes it further into saturation.
+        if self._output_updated is not None and not (
+            (output >= 1.0 and error > 0) or (output <= 0.0 and error < 0)
+        ):
+            self._output_integral = min(
+                max(
+                    self._output_integral
+                    + error
+                    * (now - self._output_updated).total_seconds()
+                    / OUTPUT_INTEGRAL_TIME,
+                    -OUTPUT_INTEGRAL_LIMIT,
+                ),
+                OUTPUT_INTEGRAL_LIMIT,
             )
+            self._async_save_controller_state()
+        self._output_updated = now
+
+        need_full_output, need_no_output = self._need_turn_on_off()
+
+        # Outside the target range the output is fully open or closed,
+        # whatever the integral term says.
+        if need_full_output:
+            demand = 1.0
+        elif need_no_output:
+            demand = 0.0
+        else:
+            demand = min(max(0.5 + error + self._output_integral, 0.0), 1.0)
+
+        current_demand = self._output_demand
 
-            need_turn_off = (
-                too_cold
-                and self._hvac_mode == HVACMode.COOL
-                or too_hot
-                and self._hvac_mode == HVACMode.HEAT
+        if (
+            current_demand is not None
+            and abs(demand - current_demand) * 100 < self._output_deadband
+            and (demand not in (0.0, 1.0) or demand == current_demand)
+        ):
+            _LOGGER.debug(
+                "%s: output change %s -> %s is within deadband, skipping",
+                self.entity_id,
+                current_demand,
+                demand,
             )
+            self._async_cancel_actuation()
+            return
 
-            if self._is_device_active and need_turn_off:
-                await self._async_heater_turn_off()
-            elif not self._is_device_active and need_turn_on:
-                await self._async_heater_turn_on()
+        await self._async_heater_set_output(demand)
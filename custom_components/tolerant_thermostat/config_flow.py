@@ -7,9 +7,16 @@ from typing import Any, cast
 
 import voluptuous as vol
 
-from homeassistant.components import fan, input_boolean, switch
+from homeassistant.components import (
+    fan,
+    input_boolean,
+    input_number,
+    number,
+    switch,
+    valve,
+)
 from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN, SensorDeviceClass
-from homeassistant.const import CONF_NAME, DEGREE
+from homeassistant.const import CONF_NAME, DEGREE, PERCENTAGE
 from homeassistant.helpers import selector
 from homeassistant.helpers.schema_config_entry_flow import (
     SchemaConfigFlowHandler,
@@ -23,7 +30,9 @@ from .const import (
     CONF_MAX_TEMP,
     CONF_MIN_DUR,
     CONF_MIN_TEMP,
+    CONF_OUTPUT_DEADBAND,
     CONF_PRECISION,
+    CONF_PREDICTIVE,
     CONF_SENSOR,
     CONF_TARGET_TEMP_HIGH,
     CONF_TARGET_TEMP_LOW,
@@ -39,7 +48,21 @@ OPTIONS_SCHEMA = {
     ),
     vol.Required(CONF_HEATER): selector.EntitySelector(
         selector.EntitySelectorConfig(
-            domain=[fan.DOMAIN, switch.DOMAIN, input_boolean.DOMAIN]
+            filter=[
+                selector.EntityFilterSelectorConfig(
+                    domain=[
+                        fan.DOMAIN,
+                        switch.DOMAIN,
+                        input_boolean.DOMAIN,
+                        number.DOMAIN,
+                        input_number.DOMAIN,
+                    ]
+                ),
+                selector.EntityFilterSelectorConfig(
+                    domain=valve.DOMAIN,
+                    supported_features=["valve.ValveEntityFeature.SET_POSITION"],
+                ),
+            ]
         )
     ),
     vol.Required(CONF_AC_MODE): selector.BooleanSelector(
@@ -79,6 +102,18 @@ OPTIONS_SCHEMA = {
             enable_day=False, enable_millisecond=False, allow_negative=False
         )
     ),
+    vol.Optional(CONF_PREDICTIVE): selector.BooleanSelector(
+        selector.BooleanSelectorConfig(),
+    ),
+    vol.Optional(CONF_OUTPUT_DEADBAND): selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=0,
+            max=100,
+            mode=selector.NumberSelectorMode.BOX,
+            unit_of_measurement=PERCENTAGE,
+            step=0.5,
+        )
+    ),
 }
 
 CONFIG_SCHEMA = {
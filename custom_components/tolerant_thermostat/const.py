@@ -7,6 +7,7 @@ DOMAIN = "tolerant_thermostat"
 PLATFORMS = [Platform.CLIMATE]
 
 DEFAULT_NAME = "Tolerant Thermostat"
+DEFAULT_OUTPUT_DEADBAND = 5.0
 
 CONF_AC_MODE = "ac_mode"
 CONF_HEATER = "heater"
@@ -15,7 +16,22 @@ CONF_MIN_DUR = "min_cycle_duration"
 CONF_SENSOR = "target_sensor"
 CONF_MIN_TEMP = "min_temp"
 CONF_MAX_TEMP = "max_temp"
+CONF_OUTPUT_DEADBAND = "output_deadband"
 CONF_PRECISION = "precision"
+CONF_PREDICTIVE = "predictive"
 CONF_TARGET_TEMP_HIGH = "target_temp_high"
 CONF_TARGET_TEMP_LOW = "target_temp_low"
 CONF_TEMP_STEP = "target_temp_step"
+
+STORAGE_KEY = DOMAIN
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 30
+
+ACTUATION_TIMEOUT = 10
+ACTUATION_MAX_RETRIES = 3
+
+PREDICTION_SAMPLES = 5
+PREDICTION_MAX_GAP = 3
+
+OUTPUT_INTEGRAL_TIME = 3600
+OUTPUT_INTEGRAL_LIMIT = 0.5
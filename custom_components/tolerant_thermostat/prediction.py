@@ -0,0 +1,107 @@
+"""Temperature extrapolation for slow reporting sensors."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime, timedelta
+import math
+
+
+class TemperaturePredictor:
+    """Extrapolate temperature between reports from recent timestamped readings.
+
+    The trend is a least squares line through the kept readings. It is only
+    extrapolated up to one average report interval past the last reading,
+    after which the next report is overdue and the prediction is held.
+    Readings are dropped when the next one arrives more than max_gap report
+    intervals later, so an outage does not skew the trend.
+    """
+
+    def __init__(self, samples: int, max_gap: int) -> None:
+        """Initialize the predictor."""
+        self._readings: deque[tuple[datetime, float]] = deque(maxlen=samples)
+        self._max_gap = max_gap
+
+    def add(self, time: datetime, value: float) -> None:
+        """Add a sensor reading."""
+        if self._readings and time <= self._readings[-1][0]:
+            return
+
+        if (interval := self.report_interval) is not None and (
+            time - self._readings[-1][0] > interval * self._max_gap
+        ):
+            self._readings.clear()
+
+        self._readings.append((time, value))
+
+    def clear(self) -> None:
+        """Drop all readings."""
+        self._readings.clear()
+
+    @property
+    def slope(self) -> float | None:
+        """Return the temperature trend in degrees per second."""
+        if len(self._readings) < 2:
+            return None
+
+        start = self._readings[0][0]
+        times = [(time - start).total_seconds() for time, _ in self._readings]
+        values = [value for _, value in self._readings]
+        mean_time = sum(times) / len(times)
+        mean_value = sum(values) / len(values)
+
+        variance = sum((time - mean_time) ** 2 for time in times)
+        if not variance:
+            return None
+
+        return (
+            sum(
+                (time - mean_time) * (value - mean_value)
+                for time, value in zip(times, values, strict=True)
+            )
+            / variance
+        )
+
+    @property
+    def report_interval(self) -> timedelta | None:
+        """Return the average interval between readings."""
+        if len(self._readings) < 2:
+            return None
+
+        return (self._readings[-1][0] - self._readings[0][0]) / (
+            len(self._readings) - 1
+        )
+
+    def predict(self, time: datetime) -> float | None:
+        """Return the extrapolated temperature at the given time."""
+        if not self._readings:
+            return None
+
+        last_time, last_value = self._readings[-1]
+        if (slope := self.slope) is None or (interval := self.report_interval) is None:
+            return last_value
+
+        elapsed = min(max(time - last_time, timedelta(0)), interval)
+        return last_value + slope * elapsed.total_seconds()
+
+    def crossing_time(self, value: float, now: datetime) -> datetime | None:
+        """Return when the extrapolated temperature reaches the given value.
+
+        None is returned if the trend does not reach the value after now
+        and before the next report is due.
+        """
+        if not self._readings:
+            return None
+
+        last_time, last_value = self._readings[-1]
+        if not (slope := self.slope) or (interval := self.report_interval) is None:
+            return None
+
+        # Round up, so the extrapolated value at this time has reached the value.
+        time = last_time + timedelta(
+            microseconds=math.ceil((value - last_value) / slope * 1_000_000)
+        )
+        if time <= now or time > last_time + interval:
+            return None
+
+        return time
@@ -0,0 +1,63 @@
+"""Persistent controller state for the Tolerant Thermostat."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, STORAGE_KEY, STORAGE_SAVE_DELAY, STORAGE_VERSION
+
+DATA_STORE = f"{DOMAIN}_store"
+
+
+class TolerantThermostatStore:
+    """Hold controller state of all thermostats in a single storage file.
+
+    Updates only schedule a delayed save, so any number of changes made
+    within the save delay end up in one disk write.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+        self._data: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load stored data."""
+        if (data := await self._store.async_load()) is not None:
+            self._data = data
+
+    @callback
+    def async_get(self, key: str) -> dict[str, Any]:
+        """Return stored controller state of a thermostat."""
+        return dict(self._data.get(key, {}))
+
+    @callback
+    def async_update(self, key: str, data: dict[str, Any]) -> None:
+        """Update controller state of a thermostat and schedule a save."""
+        self._data[key] = data
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def async_remove(self, key: str) -> None:
+        """Remove controller state of a thermostat and schedule a save."""
+        if self._data.pop(key, None) is not None:
+            self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return data of all thermostats to store in a file."""
+        return self._data
+
+
+@singleton(DATA_STORE)
+async def async_get_store(hass: HomeAssistant) -> TolerantThermostatStore:
+    """Return the shared store, loading it on first access."""
+    store = TolerantThermostatStore(hass)
+    await store.async_load()
+    return store